@@ -1,4 +1,4 @@
-import inspect
+import sys
 from functools import wraps
 from ovos_utils.log import LOG
 
@@ -6,20 +6,24 @@ from ovos_utils.log import LOG
 def dig_for_skill(max_records: int = 10):
     from ovos_workshop.app import OVOSAbstractApplication
     from ovos_workshop.skills import MycroftSkill
-    stack = inspect.stack()[1:]  # First frame will be this function call
-    stack = stack if len(stack) <= max_records else stack[:max_records]
-    for record in stack:
-        args = inspect.getargvalues(record.frame)
-        if args.locals.get("self"):
-            obj = args.locals["self"]
+    # walk the frames directly, inspect.stack() would also read the source
+    # files of every frame to provide context lines that are not used
+    frame = sys._getframe(1)  # First frame would be this function call
+    for _ in range(max_records):
+        if frame is None:
+            break
+        f_locals = frame.f_locals
+        if f_locals.get("self"):
+            obj = f_locals["self"]
             if isinstance(obj, MycroftSkill) or \
                     isinstance(obj, OVOSAbstractApplication):
                 return obj
-        elif args.locals.get("args"):
-            for obj in args.locals["args"]:
+        elif f_locals.get("args"):
+            for obj in f_locals["args"]:
                 if isinstance(obj, MycroftSkill) or \
                         isinstance(obj, OVOSAbstractApplication):
                     return obj
+        frame = frame.f_back
     return None
 
 
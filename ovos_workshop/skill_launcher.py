@@ -1,24 +1,32 @@
 import gc
-import importlib
+import importlib.util
+import inspect
 import os
 from os.path import isdir
 import sys
-from inspect import isclass
+import weakref
+from functools import lru_cache, partial
+from threading import Lock, Thread
 from types import ModuleType
 from typing import Optional
 
-from time import time
+from time import monotonic, time
 
 from ovos_bus_client.client import MessageBusClient
 from ovos_bus_client.message import Message
 from ovos_config.config import Configuration
 from ovos_config.locale import setup_locale
+from ovos_config.locations import DEFAULT_CONFIG, SYSTEM_CONFIG, \
+    USER_CONFIG, WEB_CONFIG_CACHE
 from ovos_plugin_manager.skills import find_skill_plugins
 from ovos_utils import wait_for_exit_signal
-from ovos_utils.file_utils import FileWatcher
+from ovos_utils.file_utils import FileEventHandler
 from ovos_utils.log import LOG
 from ovos_utils.process_utils import RuntimeRequirements
 from ovos_utils.skills.locations import get_skill_directories as _get_skill_dirs
+from ovos_utils.skills.locations import \
+    get_default_skills_directory as _get_default_skills_dir
+from watchdog.observers import Observer
 
 from ovos_workshop.skills.active import ActiveSkill
 from ovos_workshop.skills.auto_translatable import UniversalSkill, UniversalFallback
@@ -29,30 +37,122 @@ from ovos_workshop.skills.fallback import FallbackSkill
 from ovos_workshop.skills.mycroft_skill import MycroftSkill
 from ovos_workshop.skills.ovos import OVOSSkill, OVOSFallbackSkill
 
-SKILL_BASE_CLASSES = [
+SKILL_BASE_CLASSES = (
     BaseSkill, MycroftSkill, OVOSSkill, OVOSFallbackSkill,
-    OVOSCommonPlaybackSkill, OVOSFallbackSkill, CommonQuerySkill, ActiveSkill,
+    OVOSCommonPlaybackSkill, CommonQuerySkill, ActiveSkill,
     FallbackSkill, UniversalSkill, UniversalFallback
-]
+)
+# set membership tests for get_skill_class
+_SKILL_BASE_SET = frozenset(SKILL_BASE_CLASSES)
 
 SKILL_MAIN_MODULE = '__init__.py'
 
+# module name -> weak refs to (module, skill class) resolved by
+# get_skill_class, must not keep unloaded skills in memory
+_SKILL_CLASS_CACHE = {}
+
+# Configuration() shared by all SkillLoader objects, reset by
+# SkillLoader.refresh_config when the configuration is updated
+_CONFIG_SNAPSHOT = None
+# buses SkillLoader.refresh_config is subscribed to, once per bus
+_CONFIG_UPDATE_BUSES = weakref.WeakSet()
+
+# skill creator -> whether it accepts `bus` and `skill_id` kwargs
+_SIG_CACHE = weakref.WeakKeyDictionary()
+
+# a single long-lived watchdog Observer is shared by all SkillLoader objects,
+# one recursive watch (inotify instance) per skills root directory is
+# scheduled on it and file changes are dispatched to the owning loader
+_OBSERVER = None
+# skill directory -> (SkillLoader, watch root), replaced (never mutated) under
+# _WATCHER_LOCK so the observer thread can read it without taking the lock
+_WATCHED = {}
+_WATCHES = {}  # watch root -> watchdog ObservedWatch
+_WATCHER_LOCK = Lock()
+# reloads run on one worker thread per SkillLoader, off the observer thread
+_RELOAD_LOCK = Lock()
+_RELOAD_RUNNING = set()  # loaders with a reload worker thread
+_RELOAD_PENDING = set()  # loaders with a file change not yet handled
+
+# skill directories resolved from the default Configuration(), only valid
+# while the XDG environment and config files they were computed from are
+# unchanged, and for at most _SKILL_DIRS_TTL seconds
+_SKILL_DIRS_CACHE = {"sig": None, "expires": 0, "dirs": None,
+                     "default": None}
+_SKILL_DIRS_TTL = 60
+
+
+def _skill_dirs_signature() -> tuple:
+    """
+    Return the environment state skill directories are derived from
+    """
+    files = []
+    for path in (DEFAULT_CONFIG, SYSTEM_CONFIG, USER_CONFIG,
+                 WEB_CONFIG_CACHE):
+        try:
+            st = os.stat(path)
+            files.append((st.st_mtime_ns, st.st_size))
+        except OSError:
+            files.append(None)
+    return (os.environ.get("XDG_DATA_HOME"), os.environ.get("XDG_DATA_DIRS"),
+            tuple(files))
+
+
+def _invalidate_skill_dirs_cache():
+    """
+    Drop memoized skill directories, next call will reload Configuration()
+    """
+    _SKILL_DIRS_CACHE["sig"] = None
+    _SKILL_DIRS_CACHE["expires"] = 0
+    _SKILL_DIRS_CACHE["dirs"] = None
+    _SKILL_DIRS_CACHE["default"] = None
+
+
+def _validate_skill_dirs_cache():
+    """
+    Invalidate memoized skill directories if the XDG environment or a config
+    file changed, or the cached values expired
+    """
+    sig = _skill_dirs_signature()
+    now = monotonic()
+    if _SKILL_DIRS_CACHE["sig"] != sig or now >= _SKILL_DIRS_CACHE["expires"]:
+        _invalidate_skill_dirs_cache()
+        _SKILL_DIRS_CACHE["sig"] = sig
+        _SKILL_DIRS_CACHE["expires"] = now + _SKILL_DIRS_TTL
+
+
+def _get_cached_skill_dirs(conf=None) -> list:
+    """
+    Return skill directories, memoized when no explicit config is passed
+    """
+    if conf:
+        return _get_skill_dirs(conf)
+    _validate_skill_dirs_cache()
+    if _SKILL_DIRS_CACHE["dirs"] is None:
+        _SKILL_DIRS_CACHE["dirs"] = _get_skill_dirs(Configuration())
+    return list(_SKILL_DIRS_CACHE["dirs"])
+
 
 def get_skill_directories(conf=None):
     # TODO: Deprecate in 0.1.0
     LOG.warning(f"This method has moved to `ovos_utils.skills.locations` "
                 f"and will be removed in a future release.")
-    conf = conf or Configuration()
-    return _get_skill_dirs(conf)
+    return _get_cached_skill_dirs(conf)
 
 
 def get_default_skills_directory(conf=None):
     # TODO: Deprecate in 0.1.0
     LOG.warning(f"This method has moved to `ovos_utils.skills.locations` "
                 f"and will be removed in a future release.")
-    from ovos_utils.skills.locations import get_default_skills_directory
-    conf = conf or Configuration()
-    return get_default_skills_directory(conf)
+    if conf:
+        return _get_default_skills_dir(conf)
+    _validate_skill_dirs_cache()
+    skills_folder = _SKILL_DIRS_CACHE["default"]
+    # the folder is created on lookup, only redo it if it was removed since
+    if skills_folder is None or not isdir(skills_folder):
+        skills_folder = _get_default_skills_dir(Configuration())
+        _SKILL_DIRS_CACHE["default"] = skills_folder
+    return skills_folder
 
 
 def remove_submodule_refs(module_name: str):
@@ -65,16 +165,18 @@ def remove_submodule_refs(module_name: str):
     Args:
         module_name: name of skill module.
     """
-    submodules = []
-    LOG.debug(f'Skill module: {module_name}')
-    # Collect found submodules
-    for m in sys.modules:
-        if m.startswith(module_name + '.'):
-            submodules.append(m)
+    prefix = module_name + '.'
+    plen = len(prefix)
+    first = prefix[0]
+    # Collect found submodules, snapshot keys since imports may run meanwhile
+    submodules = [m for m in list(sys.modules)
+                  if len(m) > plen and m[0] == first and m.startswith(prefix)]
+    # lazy %-style args, message is only formatted if debug is enabled
+    LOG.debug("Removing %d submodule refs for %s: %s",
+              len(submodules), module_name, submodules)
     # Remove all references them to in sys.modules
     for m in submodules:
-        LOG.debug(f'Removing sys.modules ref for {m}')
-        del sys.modules[m]
+        sys.modules.pop(m, None)
 
 
 def load_skill_module(path: str, skill_id: str) -> ModuleType:
@@ -92,14 +194,32 @@ def load_skill_module(path: str, skill_id: str) -> ModuleType:
     module_name = skill_id.replace('.', '_')
 
     remove_submodule_refs(module_name)
+    # module is about to be (re)executed, a resolved skill class is stale
+    _forget_skill_class(module_name)
 
     spec = importlib.util.spec_from_file_location(module_name, path)
     mod = importlib.util.module_from_spec(spec)
     sys.modules[module_name] = mod
-    spec.loader.exec_module(mod)
+    # NOTE: executed eagerly on purpose, the skill class is looked up right
+    # after loading anyway and errors must surface here to be reported as
+    # a failure to load the skill source
+    try:
+        spec.loader.exec_module(mod)
+    except BaseException:
+        # same as the import system, do not keep partially loaded modules
+        sys.modules.pop(module_name, None)
+        raise
     return mod
 
 
+def _forget_skill_class(module_name: str):
+    """
+    Drop the resolved skill class of a module from the cache
+    @param module_name: name of the skill module
+    """
+    _SKILL_CLASS_CACHE.pop(module_name, None)
+
+
 def get_skill_class(skill_module: ModuleType) -> Optional[callable]:
     """Find MycroftSkill based class in skill module.
 
@@ -116,26 +236,34 @@ def get_skill_class(skill_module: ModuleType) -> Optional[callable]:
         # either a func that returns the skill or the skill class itself
         return skill_module
 
+    module_name = getattr(skill_module, "__name__", "")
+    cached = _SKILL_CLASS_CACHE.get(module_name)
+    if cached and cached[0]() is skill_module:
+        return cached[1]() if cached[1] is not None else None
+
+    base_set = _SKILL_BASE_SET
     candidates = []
     for name, obj in skill_module.__dict__.items():
-        if isclass(obj):
-            if any(issubclass(obj, c) for c in SKILL_BASE_CLASSES) and \
-                    not any(obj is c for c in SKILL_BASE_CLASSES):
-                candidates.append(obj)
+        # a skill class has a base class in its MRO but is not one itself
+        if isinstance(obj, type) and obj not in base_set and \
+                not base_set.isdisjoint(obj.__mro__):
+            candidates.append(obj)
 
-    for candidate in list(candidates):
-        others = [clazz for clazz in candidates if clazz != candidate]
-        # if we found a subclass of this candidate, it is not the final skill
-        if any(issubclass(clazz, candidate) for clazz in others):
-            candidates.remove(candidate)
+    # if we found a subclass of a candidate, that one is not the final skill
+    parents = set().union(*(c.__mro__[1:] for c in candidates))
+    candidates = [c for c in candidates if c not in parents]
 
+    skill_class = None
     if candidates:
         if len(candidates) > 1:
             LOG.warning(f"Multiple skills found in a single file!\n"
                         f"{candidates}")
         LOG.debug(f"Loading skill class: {candidates[0]}")
-        return candidates[0]
-    return None
+        skill_class = candidates[0]
+    _SKILL_CLASS_CACHE[module_name] = (
+        weakref.ref(skill_module),
+        weakref.ref(skill_class) if skill_class is not None else None)
+    return skill_class
 
 
 def get_create_skill_function(skill_module) -> Optional[callable]:
@@ -147,12 +275,154 @@ def get_create_skill_function(skill_module) -> Optional[callable]:
     Returns:
         (function): Found create_skill function or None.
     """
-    if hasattr(skill_module, "create_skill") and \
-            callable(skill_module.create_skill):
-        return skill_module.create_skill
+    create_skill = getattr(skill_module, "create_skill", None)
+    if callable(create_skill):
+        return create_skill
     return None
 
 
+def _get_config_snapshot() -> dict:
+    """
+    Return the shared configuration, loading it on first use
+    """
+    global _CONFIG_SNAPSHOT
+    if _CONFIG_SNAPSHOT is None:
+        _CONFIG_SNAPSHOT = Configuration()
+    return _CONFIG_SNAPSHOT
+
+
+def _accepts_bus_and_skill_id(skill_creator: callable) -> Optional[bool]:
+    """
+    Check if a skill class or create_skill function accepts `bus` and
+    `skill_id` kwargs, results are cached per callable
+    @param skill_creator: skill class or create_skill function
+    @return: True/False, None if the signature can not be inspected
+    """
+    try:
+        return _SIG_CACHE[skill_creator]
+    except (KeyError, TypeError):
+        pass
+    try:
+        params = inspect.signature(skill_creator).parameters
+    except (TypeError, ValueError):
+        return None
+    var_kw = any(p.kind == p.VAR_KEYWORD for p in params.values())
+    accepts_kw = var_kw or ("bus" in params and "skill_id" in params)
+    try:
+        _SIG_CACHE[skill_creator] = accepts_kw
+    except TypeError:
+        pass  # can not be weak referenced, do not cache
+    return accepts_kw
+
+
+def _get_observer():
+    """
+    Return the shared watchdog Observer, starting it on first use
+    """
+    global _OBSERVER
+    if _OBSERVER is None:
+        _OBSERVER = Observer()
+        _OBSERVER.start()
+    return _OBSERVER
+
+
+def _sync_watches(watched: dict):
+    """
+    Schedule the watch roots used by `watched` and unschedule unused ones,
+    must be called with _WATCHER_LOCK held
+    @param watched: skill directory -> (SkillLoader, watch root)
+    """
+    global _WATCHED
+    roots = {root for _, root in watched.values()}
+    for root in roots:
+        if root not in _WATCHES:
+            handler = FileEventHandler(root, partial(_dispatch_filechange,
+                                                     watched_dir=root))
+            _WATCHES[root] = _get_observer().schedule(handler, root,
+                                                      recursive=True)
+    _WATCHED = watched
+    for root in [r for r in _WATCHES if r not in roots]:
+        _OBSERVER.unschedule(_WATCHES.pop(root))
+
+
+def _watch_skill_directory(loader: "SkillLoader"):
+    """
+    Watch the skill directory of `loader` for changes, skills sharing a
+    skills directory are watched with a single watch of that directory
+    """
+    skill_dir = loader.skill_directory
+    with _WATCHER_LOCK:
+        if _WATCHED.get(skill_dir, (None,))[0] is loader:
+            return
+        watched = dict(_WATCHED)
+        watched[skill_dir] = (loader, skill_dir)
+        skills_root = os.path.dirname(os.path.normpath(skill_dir))
+        if skills_root in (os.path.normpath(d)
+                           for d in get_skill_directories()):
+            siblings = [d for d in watched if
+                        os.path.dirname(os.path.normpath(d)) == skills_root]
+            if len(siblings) > 1:
+                for d in siblings:
+                    watched[d] = (watched[d][0], skills_root)
+        _sync_watches(watched)
+
+
+def _unwatch_skill_directory(loader: "SkillLoader"):
+    """
+    Stop watching the skill directory of `loader`
+    """
+    with _WATCHER_LOCK:
+        watched = {skill_dir: entry for skill_dir, entry in _WATCHED.items()
+                   if entry[0] is not loader}
+        if len(watched) != len(_WATCHED):
+            _sync_watches(watched)
+
+
+def _dispatch_filechange(path: str, watched_dir: Optional[str] = None):
+    """
+    Notify the SkillLoader owning the changed file, runs on the observer
+    thread and must not block, the reload is handed to a worker thread
+    @param path: path of the file that changed
+    @param watched_dir: directory of the watch reporting the change, nested
+        watch roots report some changes twice
+    """
+    owner = None
+    owner_dir = ""
+    owner_root = None
+    for skill_dir, (loader, root) in _WATCHED.items():
+        try:
+            if os.path.commonpath([path, skill_dir]) != skill_dir:
+                continue
+        except ValueError:
+            continue  # mix of absolute and relative paths
+        # nested skill directories, the innermost one owns the file
+        if len(skill_dir) > len(owner_dir):
+            owner, owner_dir, owner_root = loader, skill_dir, root
+    if watched_dir is not None and owner_root != watched_dir:
+        return  # the watch of the owning directory reports it too
+    if owner:
+        with _RELOAD_LOCK:
+            _RELOAD_PENDING.add(owner)
+            if owner in _RELOAD_RUNNING:
+                return  # the running worker reloads again when done
+            _RELOAD_RUNNING.add(owner)
+        Thread(target=_run_filechanges, args=(owner,), daemon=True).start()
+
+
+def _run_filechanges(loader: "SkillLoader"):
+    """
+    Reload `loader` until no file change is pending, changes reported while
+    reloading are handled by a single extra reload
+    """
+    while True:
+        with _RELOAD_LOCK:
+            if loader not in _RELOAD_PENDING:
+                _RELOAD_RUNNING.discard(loader)
+                return
+            _RELOAD_PENDING.discard(loader)
+        loader._handle_filechange()
+
+
 class SkillLoader:
     def __init__(self, bus, skill_directory=None, skill_id=None):
         self.bus = bus
@@ -162,11 +432,43 @@ class SkillLoader:
         self._loaded = None
         self.load_attempted = False
         self.last_loaded = 0
-        self.instance: BaseSkill = None
+        self.instance: Optional[BaseSkill] = None
         self.active = True
-        self._watchdog = None
-        self.config = Configuration()
+        self._watching = False
+        self._config = None  # override, shared configuration used if unset
         self.skill_module = None
+        self._blacklist = frozenset()
+        self._blacklist_config = None  # configuration _blacklist was read from
+        self._refresh_blacklist()
+        if self.bus and self.bus not in _CONFIG_UPDATE_BUSES:
+            _CONFIG_UPDATE_BUSES.add(self.bus)
+            self.bus.on("configuration.updated", self.refresh_config)
+
+    @classmethod
+    def refresh_config(cls, message=None):
+        """
+        Drop the shared configuration, it is reloaded on next access
+        """
+        global _CONFIG_SNAPSHOT
+        _CONFIG_SNAPSHOT = None
+        _invalidate_skill_dirs_cache()
+
+    @property
+    def config(self) -> dict:
+        """
+        Return the configuration used by this loader
+        """
+        if self._config is not None:
+            return self._config
+        return _get_config_snapshot()
+
+    @config.setter
+    def config(self, val: dict):
+        """
+        Set (override) the configuration used by this loader
+        """
+        self._config = val
+        self._refresh_blacklist()
 
     @property
     def loaded(self) -> bool:
@@ -242,21 +544,30 @@ class SkillLoader:
         """
         Return the skill's runtime requirements
         """
-        if not self.skill_class or not hasattr(self.skill_class,
-                                               "runtime_requirements"):
+        skill_class = self.skill_class
+        if not skill_class or not hasattr(skill_class,
+                                          "runtime_requirements"):
             return RuntimeRequirements()
-        return self.skill_class.runtime_requirements
+        return skill_class.runtime_requirements
 
     @property
     def is_blacklisted(self) -> bool:
         """
         Return true if the skill is blacklisted in configuration
         """
-        blacklist = self.config['skills'].get('blacklisted_skills') or []
-        if self.skill_id in blacklist:
-            return True
-        else:
-            return False
+        if self._blacklist_config is not self.config:
+            # shared configuration was reloaded by refresh_config
+            self._refresh_blacklist()
+        return self.skill_id in self._blacklist
+
+    def _refresh_blacklist(self):
+        """
+        Read blacklisted skills from configuration
+        """
+        config = self.config
+        self._blacklist = frozenset(
+            config.get('skills', {}).get('blacklisted_skills') or ())
+        self._blacklist_config = config
 
     @property
     def reload_allowed(self) -> bool:
@@ -292,19 +603,27 @@ class SkillLoader:
         """
         Remove listeners and stop threads before loading
         """
-        if self._watchdog:
-            self._watchdog.shutdown()
-            self._watchdog = None
+        if self.skill_id:
+            _forget_skill_class(self.skill_id.replace('.', '_'))
 
+        # full garbage collections are slow, only run them when explicitly
+        # requested to debug skills that are not released on unload
+        instance_ref = None
+        if self.config.get("skills", {}).get("gc_on_unload", False) and \
+                self.instance is not None:
+            instance_ref = weakref.ref(self.instance)
         self._execute_instance_shutdown()
-        if self.config.get("debug", False):
-            self._garbage_collect()
+        if instance_ref is not None:
+            self._garbage_collect(instance_ref)
         self._emit_skill_shutdown_event()
 
     def unload(self):
         """
         Shutdown and unload the skill instance
         """
+        if self._watching:
+            _unwatch_skill_directory(self)
+            self._watching = False
         if self.instance:
             self._execute_instance_shutdown()
 
@@ -336,13 +655,20 @@ class SkillLoader:
         del self.instance
         self.instance = None
 
-    def _garbage_collect(self):
+    def _garbage_collect(self, instance_ref: Optional[weakref.ref] = None):
         """
         Invoke Python garbage collector to remove false references
+        @param instance_ref: weak reference to the skill instance unloaded,
+            a warning is logged if it is still alive after collection
         """
+        # a full collection is needed, long-lived skill instances are in the
+        # oldest generation and would not be freed by a partial collection
         gc.collect()
+        instance = instance_ref() if instance_ref is not None else None
+        if instance is None:
+            return
         # Remove two local references that are known
-        refs = sys.getrefcount(self.instance) - 2
+        refs = sys.getrefcount(instance) - 2
         if refs > 0:
             LOG.warning(
                 f"After shutdown of {self.skill_id} there are still {refs} "
@@ -364,7 +690,10 @@ class SkillLoader:
         @return: True if skill was loaded
         """
         self._prepare_for_load()
+        # blacklist is checked before the skill source is executed
         if self.is_blacklisted:
+            self.skill_module = None  # do not keep a previous load around
+            _forget_skill_class(self.skill_id.replace('.', '_'))
             self._skip_load()
         else:
             self.skill_module = self._load_skill_source()
@@ -377,12 +706,11 @@ class SkillLoader:
 
     def _start_filewatcher(self):
         """
-        Start a FileWatcher if one isn't already active
+        Watch the skill directory with the shared Observer if not already
         """
-        if not self._watchdog:
-            self._watchdog = FileWatcher([self.skill_directory],
-                                         callback=self._handle_filechange,
-                                         recursive=True)
+        if not self._watching:
+            _watch_skill_directory(self)
+            self._watching = True
 
     def _handle_filechange(self):
         """
@@ -400,6 +728,7 @@ class SkillLoader:
         """
         Prepare SkillLoader for skill load
         """
+        self._refresh_blacklist()  # configuration might have changed
         self.load_attempted = True
         self.instance = None
 
@@ -417,13 +746,19 @@ class SkillLoader:
         """
         main_file_path = os.path.join(self.skill_directory, SKILL_MAIN_MODULE)
         skill_module = None
-        if not os.path.exists(main_file_path):
-            LOG.error(f'Failed to load {self.skill_id} due to a missing file.')
-        else:
-            try:
-                skill_module = load_skill_module(main_file_path, self.skill_id)
-            except Exception as e:
+        # no separate existence check, reading the file while loading it
+        # already fails if it is missing
+        try:
+            skill_module = load_skill_module(main_file_path, self.skill_id)
+        except FileNotFoundError as e:
+            if e.filename != main_file_path:
+                # raised by the skill code itself
                 LOG.exception(f'Failed to load skill: {self.skill_id} ({e})')
+            else:
+                LOG.error(f'Failed to load {self.skill_id} due to a '
+                          f'missing file.')
+        except Exception as e:
+            LOG.exception(f'Failed to load skill: {self.skill_id} ({e})')
         return skill_module
 
     def _create_skill_instance(self,
@@ -442,7 +777,8 @@ class SkillLoader:
 
         try:
             # in skill classes __new__ should fully create the skill object
-            skill_class = get_skill_class(skill_module)
+            # plugin skills already provide the class, there is no module
+            skill_class = self._skill_class or get_skill_class(skill_module)
             self.instance = skill_class(bus=self.bus, skill_id=self.skill_id)
             return self.instance is not None
         except Exception as e:
@@ -459,15 +795,24 @@ class SkillLoader:
 
         # if the signature supports skill_id and bus pass them
         # to fully initialize the skill in 1 go
-        try:
-            # skills that do will have bus and skill_id available
-            # as soon as they call super()
+        # skills that do will have bus and skill_id available
+        # as soon as they call super()
+        accepts_kw = _accepts_bus_and_skill_id(skill_creator)
+        if accepts_kw:
             self.instance = skill_creator(bus=self.bus,
                                           skill_id=self.skill_id)
-        except Exception as e:
+        elif accepts_kw is False:
             # most old skills do not expose bus/skill_id kwargs
-            LOG.warning(f"Legacy skill: {e}")
+            LOG.warning(f"Legacy skill: {self.skill_id}")
             self.instance = skill_creator()
+        else:
+            # signature could not be inspected, try both
+            try:
+                self.instance = skill_creator(bus=self.bus,
+                                              skill_id=self.skill_id)
+            except Exception as e:
+                LOG.warning(f"Legacy skill: {e}")
+                self.instance = skill_creator()
 
         try:
             # finish initialization of skill if we didn't manage to inject
@@ -519,6 +864,7 @@ class PluginSkillLoader(SkillLoader):
         self._skill_class = skill_class or self._skill_class
         if not self._skill_class:
             raise RuntimeError(f"_skill_class not defined for {self.skill_id}")
+        self.skill_module = None  # plugins are not loaded from a module
         return self._load()
 
     def _load(self):
@@ -538,21 +884,57 @@ class PluginSkillLoader(SkillLoader):
         return self.loaded
 
 
+def _find_local_skill_directory(skill_id: str) -> Optional[str]:
+    """
+    Find a local skill folder named `skill_id` in the skill directories
+    @param skill_id: skill identifier, also the skill folder name
+    @return: path to the skill folder or None if not found locally
+    """
+    # a single stat per candidate, a missing parent directory fails just as
+    # fast as a missing skill folder so parents are not checked separately
+    # (XDG locations can overlap, dict.fromkeys deduplicates in order)
+    for p in dict.fromkeys(_get_cached_skill_dirs()):
+        skill_directory = os.path.join(p, skill_id)
+        if isdir(skill_directory):
+            LOG.debug(f"found local skill {skill_id}: {skill_directory}")
+            return skill_directory
+    return None
+
+
+@lru_cache(maxsize=1)
+def _find_skill_plugins() -> dict:
+    """
+    Scan installed skill plugins once, the entrypoint scan is slow
+    @return: dict of skill_id -> skill plugin
+    """
+    return find_skill_plugins()
+
+
 class SkillContainer:
     def __init__(self, skill_id, skill_directory=None, bus=None):
         setup_locale()  # ensure any initializations and resource loading is handled
         self.bus = bus
         self.skill_id = skill_id
         if not skill_directory:  # preference to local skills instead of plugins
-            for p in _get_skill_dirs():
-                if isdir(f"{p}/{skill_id}"):
-                    skill_directory = f"{p}/{skill_id}"
-                    LOG.debug(f"found local skill {skill_id}: {skill_directory}")
-                    break
+            skill_directory = _find_local_skill_directory(skill_id)
         self.skill_directory = skill_directory
         self.skill_loader = None
+        self._skill_plugin = None
+
+    def _resolve_skill_plugin(self) -> callable:
+        """
+        Find the installed skill plugin for `self.skill_id`
+        @return: skill plugin to load
+        """
+        plugins = _find_skill_plugins()
+        if self.skill_id not in plugins:
+            raise ValueError(f"unknown skill_id: {self.skill_id}")
+        return plugins[self.skill_id]
 
     def _connect_to_core(self):
+        if not self.skill_directory and not self._skill_plugin:
+            # fail on unknown skills before connecting to the bus
+            self._skill_plugin = self._resolve_skill_plugin()
 
         if not self.bus:
             self.bus = MessageBusClient()
@@ -593,11 +975,7 @@ class SkillContainer:
 
     def _launch_plugin_skill(self):
         """ run a plugin skill standalone """
-
-        plugins = find_skill_plugins()
-        if self.skill_id not in plugins:
-            raise ValueError(f"unknown skill_id: {self.skill_id}")
-        skill_plugin = plugins[self.skill_id]
+        skill_plugin = self._skill_plugin or self._resolve_skill_plugin()
         self.skill_loader = PluginSkillLoader(self.bus, self.skill_id)
         try:
             self.skill_loader.load(skill_plugin)
@@ -13,11 +13,12 @@
 # limitations under the License.
 #
 """Common functionality relating to the implementation of mycroft skills."""
+import json
 import re
 import sys
 import time
 import traceback
-from copy import copy
+from copy import deepcopy
 from hashlib import md5
 from inspect import signature
 from itertools import chain
@@ -80,6 +81,22 @@ def is_classic_core():
             return False  # standalone
 
 
+def _settings_snapshot(settings) -> dict:
+    """ Deep copy settings to detect changes when compared with the live ones
+
+    settings are json data, a json round trip is considerably faster than
+    deepcopy, which is only used if the round trip does not preserve them
+    (eg. tuples or non string keys)
+    """
+    try:
+        snapshot = json.loads(json.dumps(settings))
+        if snapshot == settings:
+            return snapshot
+    except (TypeError, ValueError):
+        pass
+    return deepcopy(dict(settings))
+
+
 class SkillGUI(GUIInterface):
     """SkillGUI - Interface to the Graphical User Interface
 
@@ -258,6 +275,16 @@ class BaseSkill:
 
         self.__original_converse = self.converse
 
+        # get_response signaling, set when the user answers (or the
+        # question is aborted) and when the final response is available
+        self.__response = False
+        self.__utterance_event = Event()
+        self.__response_event = Event()
+
+        # (skill_id, stop message type, stop handled by) for "mycroft.stop",
+        # built on first use and rebuilt if skill_id changes
+        self.__stop_strings = (None, None, None)
+
         # yay, following python best practices again!
         if self.skill_id and self.bus:
             self._startup(self.bus, self.skill_id)
@@ -410,7 +437,7 @@ class BaseSkill:
             for k, v in self._initial_settings.items():
                 if k not in self._settings:
                     self._settings[k] = v
-        self._initial_settings = copy(self.settings)
+        self._initial_settings = _settings_snapshot(self.settings)
 
         self._start_filewatcher()
 
@@ -927,20 +954,26 @@ class BaseSkill:
         def converse(utterances, lang=None):
             converse.response = utterances[0] if utterances else None
             converse.finished = True
+            self.__utterance_event.set()
             return True
 
         # install a temporary conversation handler
         self._activate()
         converse.finished = False
         converse.response = None
+        self.__utterance_event.clear()
         self.converse = converse
 
         # 10 for listener, 5 for SST, then timeout
-        # NOTE: a threading.Event is not used otherwise we can't raise the
-        # AbortEvent exception to kill the thread
-        start = time.time()
-        while time.time() - start <= 15 and not converse.finished:
-            time.sleep(0.1)
+        # NOTE: the AbortEvent exception can not be raised in this thread
+        # while it is blocked waiting, _handle_killed_wait_response sets the
+        # event to wake it up so it can be killed
+        deadline = time.monotonic() + 15.0
+        while not converse.finished:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            self.__utterance_event.wait(timeout=remaining)
             if self.__response is not False:
                 if self.__response is None:
                     # aborted externally (if None)
@@ -1031,15 +1064,21 @@ class BaseSkill:
 
         """
         self.__response = False
+        self.__response_event.clear()
         self._real_wait_response(is_cancel, validator, on_fail, num_retries)
+        # the event is also set by an earlier, aborted question finishing,
+        # only a response value (or None) ends the wait
         while self.__response is False:
-            time.sleep(0.1)
+            self.__response_event.wait()
+            self.__response_event.clear()
         return self.__response
 
     # method not present in mycroft-core
     def _handle_killed_wait_response(self):
         self.__response = None
         self.converse = self.__original_converse
+        self.__utterance_event.set()
+        self.__response_event.set()
 
     # method not present in mycroft-core
     @killable_event("mycroft.skills.abort_question", exc=AbortQuestion,
@@ -1054,49 +1093,53 @@ class BaseSkill:
             on_fail (callable): function handling retries
 
         """
-        msg = dig_for_message()
-        msg = msg.reply('mycroft.mic.listen') if msg else \
-            Message('mycroft.mic.listen',
-                    context={"skill_id": self.skill_id})
-
-        num_fails = 0
-        while True:
-            if self.__response is not False:
-                # usually None when aborted externally
-                # also allows overriding returned result from other events
-                return self.__response
-
-            response = self.__get_response()
-
-            if response is None:
-                # if nothing said, prompt one more time
-                num_none_fails = 1 if num_retries < 0 else num_retries
-                if num_fails >= num_none_fails:
-                    self.__response = None
+        try:
+            msg = dig_for_message()
+            msg = msg.reply('mycroft.mic.listen') if msg else \
+                Message('mycroft.mic.listen',
+                        context={"skill_id": self.skill_id})
+
+            num_fails = 0
+            while True:
+                if self.__response is not False:
+                    # usually None when aborted externally
+                    # also allows overriding returned result from other events
+                    return self.__response
+
+                response = self.__get_response()
+
+                if response is None:
+                    # if nothing said, prompt one more time
+                    num_none_fails = 1 if num_retries < 0 else num_retries
+                    if num_fails >= num_none_fails:
+                        self.__response = None
+                        return
+                else:
+                    # catch user saying 'cancel'
+                    if is_cancel(response):
+                        self.__response = None
+                        return
+
+                validated = validator(response)
+                # returns the validated value or the response
+                # (backwards compat)
+                if validated is not False and validated is not None:
+                    self.__response = response if validated is True else validated
                     return
-            else:
-                # catch user saying 'cancel'
-                if is_cancel(response):
+
+                num_fails += 1
+                if 0 < num_retries < num_fails or self.__response is not False:
                     self.__response = None
                     return
 
-            validated = validator(response)
-            # returns the validated value or the response
-            # (backwards compat)
-            if validated is not False and validated is not None:
-                self.__response = response if validated is True else validated
-                return
-
-            num_fails += 1
-            if 0 < num_retries < num_fails or self.__response is not False:
-                self.__response = None
-                return
-
-            line = on_fail(response)
-            if line:
-                self.speak(line, expect_response=True)
-            else:
-                self.bus.emit(msg)
+                line = on_fail(response)
+                if line:
+                    self.speak(line, expect_response=True)
+                else:
+                    self.bus.emit(msg)
+        finally:
+            # wake up _wait_response, also when the thread is killed
+            self.__response_event.set()
 
     def ask_yesno(self, prompt, data=None):
         """Read prompt and wait for a yes/no answer
@@ -1348,7 +1391,7 @@ class BaseSkill:
         """
         if self.settings != self._initial_settings:
             self.settings.store()
-            self._initial_settings = copy(self.settings)
+            self._initial_settings = _settings_snapshot(self.settings)
         if handler_info:
             msg_type = handler_info + '.complete'
             message.context["skill_id"] = self.skill_id
@@ -1357,11 +1400,11 @@ class BaseSkill:
     # method not present in mycroft-core
     def _on_event_error(self, error, message, handler_info, skill_data, speak_errors):
         """Speak and log the error."""
-        # Convert "MyFancySkill" to "My Fancy Skill" for speaking
-        handler_name = camel_case_split(self.name)
-        msg_data = {'skill': handler_name}
-        speech = get_dialog('skill.error', self.lang, msg_data)
         if speak_errors:
+            # Convert "MyFancySkill" to "My Fancy Skill" for speaking
+            handler_name = camel_case_split(self.name)
+            msg_data = {'skill': handler_name}
+            speech = get_dialog('skill.error', self.lang, msg_data)
             self.speak(speech)
         self.log.exception(error)
         # append exception information in message
@@ -1388,19 +1431,23 @@ class BaseSkill:
                                            an exception happens inside the handler
         """
         skill_data = {'name': get_handler_name(handler)}
+        # resolved once here instead of on every event
+        on_event_start = self._on_event_start
+        on_event_end = self._on_event_end
+        on_event_error = self._on_event_error
 
         def on_error(error, message):
             if isinstance(error, AbortEvent):
                 self.log.info("Skill execution aborted")
-                self._on_event_end(message, handler_info, skill_data)
+                on_event_end(message, handler_info, skill_data)
                 return
-            self._on_event_error(error, message, handler_info, skill_data, speak_errors)
+            on_event_error(error, message, handler_info, skill_data, speak_errors)
 
         def on_start(message):
-            self._on_event_start(message, handler_info, skill_data)
+            on_event_start(message, handler_info, skill_data)
 
         def on_end(message):
-            self._on_event_end(message, handler_info, skill_data)
+            on_event_end(message, handler_info, skill_data)
 
         wrapper = create_wrapper(handler, self.skill_id, on_start, on_end,
                                  on_error)
@@ -1791,15 +1838,21 @@ class BaseSkill:
         """Handler for the "mycroft.stop" signal. Runs the user defined
         `stop()` method.
         """
-        message.context['skill_id'] = self.skill_id
-        self.bus.emit(message.forward(self.skill_id + ".stop"))
+        skill_id = self.skill_id
+        bus = self.bus
+        if self.__stop_strings[0] != skill_id:
+            self.__stop_strings = (skill_id, f"{skill_id}.stop",
+                                   f"skill:{skill_id}")
+        _, stop_msg_type, stop_handled_by = self.__stop_strings
+        message.context['skill_id'] = skill_id
+        bus.emit(message.forward(stop_msg_type))
         try:
             if self.stop():
-                self.bus.emit(message.reply("mycroft.stop.handled",
-                                            {"by": "skill:" + self.skill_id},
-                                            {"skill_id": self.skill_id}))
+                bus.emit(message.reply("mycroft.stop.handled",
+                                       {"by": stop_handled_by},
+                                       {"skill_id": skill_id}))
         except Exception as e:
-            self.log.exception(f'Failed to stop skill: {self.skill_id}')
+            self.log.exception(f'Failed to stop skill: {skill_id}')
 
     def stop(self):
         """Optional method implemented by subclass."""
@@ -21,7 +21,8 @@ from os.path import join, exists, dirname
 
 from ovos_utils.log import LOG
 
-from ovos_workshop.skills.base import BaseSkill, is_classic_core
+from ovos_workshop.skills.base import BaseSkill, is_classic_core, \
+    _settings_snapshot
 
 
 class _SkillMetaclass(ABCMeta):
@@ -187,7 +188,7 @@ class MycroftSkill(BaseSkill, metaclass=_SkillMetaclass):
             try:
                 from mycroft.skills.settings import save_settings
                 save_settings(self.settings_write_path, self.settings)
-                self._initial_settings = dict(self.settings)
+                self._initial_settings = _settings_snapshot(self.settings)
             except Exception as e:
                 LOG.exception("Failed to save skill settings")
         if handler_info:
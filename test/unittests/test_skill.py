@@ -1,6 +1,6 @@
 import json
 import unittest
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 from ovos_bus_client import Message
 
@@ -159,6 +159,47 @@ class TestSkill(unittest.TestCase):
 
         skill.stop = real_stop
 
+    def test_settings_change_detection(self):
+        skill = self.skill.instance
+        if is_classic_core():
+            self.skipTest("mycroft-core stores settings with save_settings")
+        skill.settings.store = Mock()
+        message = Message("test")
+
+        # nested in-place edits are detected
+        skill.settings["nested"] = {"value": 1}
+        skill._on_event_end(message, None, {})
+        self.assertEqual(skill.settings.store.call_count, 1)
+        skill.settings["nested"]["value"] = 2
+        skill._on_event_end(message, None, {})
+        self.assertEqual(skill.settings.store.call_count, 2)
+        self.assertEqual(skill._initial_settings["nested"], {"value": 2})
+
+        # values not preserved by a json round trip are not re-stored
+        skill.settings["coords"] = (1, 2)
+        skill._on_event_end(message, None, {})
+        self.assertEqual(skill.settings.store.call_count, 3)
+        skill._on_event_end(message, None, {})
+        self.assertEqual(skill.settings.store.call_count, 3)
+
+        del skill.settings.store
+
+    def test_event_error_speak_errors(self):
+        skill = self.skill.instance
+        real_speak = skill.speak
+        skill.speak = Mock()
+        with patch("ovos_workshop.skills.base.get_dialog") as get_dialog:
+            skill._on_event_error(ValueError("test"), Message("test"),
+                                  None, {}, speak_errors=False)
+            get_dialog.assert_not_called()
+            skill.speak.assert_not_called()
+
+            skill._on_event_error(ValueError("test"), Message("test"),
+                                  None, {}, speak_errors=True)
+            get_dialog.assert_called_once()
+            skill.speak.assert_called_once_with(get_dialog.return_value)
+        skill.speak = real_speak
+
     def tearDown(self) -> None:
         self.skill.unload()
 
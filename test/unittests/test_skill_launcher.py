@@ -1,8 +1,9 @@
 import shutil
 import unittest
 import sys
+from unittest.mock import patch
 
-from os import environ
+from os import environ, makedirs
 from os.path import basename, join, dirname, isdir
 
 from ovos_utils.messagebus import FakeBus
@@ -52,9 +53,62 @@ class TestSkillLauncherFunctions(unittest.TestCase):
         self.assertEqual(basename(test_dir), 'test')
         self.assertEqual(dirname(dirname(test_dir)), self.test_data_path)
 
+    @patch("ovos_workshop.skill_launcher.Configuration")
+    def test_skill_directories_cache(self, config):
+        from ovos_workshop.skill_launcher import get_skill_directories, \
+            _invalidate_skill_dirs_cache
+        config.return_value = {'skills': {}}
+        _invalidate_skill_dirs_cache()
+        dirs = get_skill_directories()
+        self.assertEqual(get_skill_directories(), dirs)
+        config.assert_called_once()
+        # XDG environment change invalidates the cache
+        environ['XDG_DATA_DIRS'] = join(self.test_data_path, "extra")
+        try:
+            get_skill_directories()
+            self.assertEqual(config.call_count, 2)
+        finally:
+            environ.pop('XDG_DATA_DIRS')
+            _invalidate_skill_dirs_cache()
+
+    @patch("ovos_workshop.skill_launcher.Configuration")
+    def test_skill_directories_cache_config_change(self, config):
+        from ovos_workshop.skill_launcher import get_skill_directories, \
+            _invalidate_skill_dirs_cache, _SKILL_DIRS_TTL
+        from tempfile import NamedTemporaryFile
+        config.return_value = {'skills': {}}
+        with NamedTemporaryFile("w", suffix=".conf") as user_config, \
+                patch("ovos_workshop.skill_launcher.USER_CONFIG",
+                      user_config.name):
+            _invalidate_skill_dirs_cache()
+            get_skill_directories()
+            get_skill_directories()
+            config.assert_called_once()
+            # editing a config file invalidates the cache
+            user_config.write('{"skills": {"directory": "test"}}')
+            user_config.flush()
+            get_skill_directories()
+            self.assertEqual(config.call_count, 2)
+            # cached values expire
+            with patch("ovos_workshop.skill_launcher.monotonic",
+                       return_value=10 ** 9 + _SKILL_DIRS_TTL):
+                get_skill_directories()
+            self.assertEqual(config.call_count, 3)
+        _invalidate_skill_dirs_cache()
+
     def test_remove_submodule_refs(self):
         from ovos_workshop.skill_launcher import remove_submodule_refs
-        pass
+        from types import ModuleType
+        for name in ("test_refs", "test_refs.sub", "test_refs.sub.mod",
+                     "test_refs_other"):
+            sys.modules[name] = ModuleType(name)
+        remove_submodule_refs("test_refs")
+        self.assertIn("test_refs", sys.modules)
+        self.assertIn("test_refs_other", sys.modules)
+        self.assertNotIn("test_refs.sub", sys.modules)
+        self.assertNotIn("test_refs.sub.mod", sys.modules)
+        sys.modules.pop("test_refs")
+        sys.modules.pop("test_refs_other")
 
     def test_load_skill_module(self):
         from ovos_workshop.skill_launcher import load_skill_module
@@ -70,6 +124,7 @@ class TestSkillLauncherFunctions(unittest.TestCase):
         from ovos_workshop.skill_launcher import get_skill_class, \
             load_skill_module
         from ovos_workshop.skills.mycroft_skill import _SkillMetaclass
+        from types import ModuleType
         test_path = join(dirname(__file__), "skills", "test_skill",
                          "__init__.py")
         skill_id = "test_skill.test"
@@ -78,6 +133,22 @@ class TestSkillLauncherFunctions(unittest.TestCase):
         self.assertIsNotNone(skill)
         self.assertEqual(skill.__class__, _SkillMetaclass, skill.__class__)
 
+        # Test cached lookup and invalidation on reload
+        self.assertIs(get_skill_class(module), skill)
+        reloaded = load_skill_module(test_path, skill_id)
+        self.assertIsNot(get_skill_class(reloaded), skill)
+
+        # Test cache does not keep modules alive
+        import gc
+        from ovos_workshop.skill_launcher import _SKILL_CLASS_CACHE
+        module_ref = _SKILL_CLASS_CACHE["test_skill_test"][0]
+        self.assertIs(module_ref(), reloaded)
+        del module, reloaded, skill
+        sys.modules.pop("test_skill_test")
+        gc.collect()
+        self.assertIsNone(module_ref())
+        self.assertIsNone(get_skill_class(ModuleType("test_skill_test")))
+
         # Test invalid request
         with self.assertRaises(ValueError):
             get_skill_class(None)
@@ -93,6 +164,106 @@ class TestSkillLauncherFunctions(unittest.TestCase):
         self.assertIsNotNone(func)
         self.assertEqual(func.__name__, "create_skill")
 
+    def test_accepts_bus_and_skill_id(self):
+        from ovos_workshop.skill_launcher import _accepts_bus_and_skill_id
+
+        def legacy():
+            pass
+
+        def new_style(bus=None, skill_id=""):
+            pass
+
+        def any_kwargs(*args, **kwargs):
+            pass
+
+        self.assertFalse(_accepts_bus_and_skill_id(legacy))
+        self.assertTrue(_accepts_bus_and_skill_id(new_style))
+        self.assertTrue(_accepts_bus_and_skill_id(any_kwargs))
+        # cached result
+        self.assertFalse(_accepts_bus_and_skill_id(legacy))
+
+    def test_dispatch_filechange(self):
+        from ovos_workshop.skill_launcher import _dispatch_filechange
+        from threading import Event
+        from unittest.mock import Mock
+
+        def loader():
+            skill = Mock()
+            skill.called = Event()
+            skill._handle_filechange.side_effect = skill.called.set
+            return skill
+
+        skill = loader()
+        nested_skill = loader()
+        watched = {"/skills/skill.test": (skill, "/skills"),
+                   "/skills/skill.test/nested":
+                       (nested_skill, "/skills/skill.test/nested")}
+        with patch("ovos_workshop.skill_launcher._WATCHED", watched):
+            # reloads are handed to a worker thread
+            _dispatch_filechange("/skills/skill.test/__init__.py")
+            self.assertTrue(skill.called.wait(5))
+            _dispatch_filechange("/skills/skill.test/nested/__init__.py")
+            self.assertTrue(nested_skill.called.wait(5))
+            skill._handle_filechange.assert_called_once()
+            # unwatched directory
+            _dispatch_filechange("/skills/skill.test2/__init__.py")
+            # the outer watch also reports nested changes, only dispatch once
+            nested_skill.called.clear()
+            _dispatch_filechange("/skills/skill.test/nested/__init__.py",
+                                 watched_dir="/skills")
+            self.assertFalse(nested_skill.called.wait(0.5))
+            skill._handle_filechange.assert_called_once()
+            nested_skill._handle_filechange.assert_called_once()
+
+    def test_reload_while_watching(self):
+        from ovos_workshop import skill_launcher
+        from ovos_workshop.skill_launcher import _watch_skill_directory, \
+            _unwatch_skill_directory
+        from tempfile import mkdtemp
+        from threading import Event, Thread
+        from unittest.mock import Mock
+        root = mkdtemp()
+        skills = []
+        for name in ("skill.a", "skill.b", "skill.c"):
+            makedirs(join(root, name))
+            skills.append(Mock(skill_directory=join(root, name)))
+        reloading, proceed, reloaded = Event(), Event(), Event()
+
+        def reload():
+            # what SkillLoader.reload does to the watches
+            reloading.set()
+            proceed.wait(5)
+            _unwatch_skill_directory(skills[0])
+            _watch_skill_directory(skills[0])
+            reloaded.set()
+
+        skills[0]._handle_filechange.side_effect = reload
+        with patch("ovos_workshop.skill_launcher.get_skill_directories",
+                   return_value=[root]):
+            try:
+                _watch_skill_directory(skills[0])
+                _watch_skill_directory(skills[1])
+                with open(join(root, "skill.a", "__init__.py"), "w") as f:
+                    f.write("# changed")
+                self.assertTrue(reloading.wait(5))
+                # another skill registers its watch while reloading
+                registering = Thread(target=_watch_skill_directory,
+                                     args=(skills[2],), daemon=True)
+                registering.start()
+                registering.join(0.5)
+                proceed.set()
+                registering.join(5)
+                self.assertFalse(registering.is_alive())
+                self.assertTrue(reloaded.wait(5))
+                # skills in one skills directory share a single watch
+                self.assertEqual(list(skill_launcher._WATCHES), [root])
+            finally:
+                proceed.set()
+                for skill in skills:
+                    _unwatch_skill_directory(skill)
+                shutil.rmtree(root)
+        self.assertEqual(skill_launcher._WATCHES, {})
+
     def test_launch_script(self):
         from ovos_workshop.skill_launcher import _launch_script
         # TODO
@@ -115,6 +286,92 @@ class TestSkillLoader(unittest.TestCase):
         self.assertFalse(loader.is_blacklisted)
         self.assertTrue(loader.reload_allowed)
 
+        # Blacklist is read from configuration
+        loader.skill_id = "blacklisted.skill"
+        loader.config = {'skills': {'blacklisted_skills': ["blacklisted.skill"]}}
+        self.assertTrue(loader.is_blacklisted)
+        loader.config = {'skills': {}}
+        self.assertFalse(loader.is_blacklisted)
+
+    @patch("ovos_workshop.skill_launcher.Configuration")
+    def test_skill_loader_shared_config(self, config):
+        from ovos_workshop.skill_launcher import SkillLoader
+        config.side_effect = lambda: {'skills': {}}
+        SkillLoader.refresh_config()
+        loader = SkillLoader(self.bus)
+        other = SkillLoader(self.bus)
+        self.assertIs(loader.config, other.config)
+        config.assert_called_once()
+        # configuration update reloads it for all loaders
+        old_config = loader.config
+        SkillLoader.refresh_config()
+        self.assertIsNot(loader.config, old_config)
+        self.assertIs(loader.config, other.config)
+        # blacklist follows the reloaded configuration
+        loader.skill_id = "blacklisted.skill"
+        self.assertFalse(loader.is_blacklisted)
+        config.side_effect = lambda: {
+            'skills': {'blacklisted_skills': ["blacklisted.skill"]}}
+        SkillLoader.refresh_config()
+        self.assertTrue(loader.is_blacklisted)
+        SkillLoader.refresh_config()
+
+    def test_skill_loader_config_handler(self):
+        from ovos_workshop.skill_launcher import SkillLoader
+        from unittest.mock import Mock
+        bus = Mock()
+        SkillLoader(bus)
+        SkillLoader(bus)
+        bus.on.assert_called_once_with("configuration.updated",
+                                       SkillLoader.refresh_config)
+
+    @patch("ovos_workshop.skill_launcher.gc.collect")
+    def test_skill_loader_unload_gc(self, collect):
+        from ovos_workshop.skill_launcher import SkillLoader
+        from unittest.mock import Mock
+        loader = SkillLoader(self.bus, skill_id="gc.test")
+        # no garbage collection unless requested
+        loader.config = {'skills': {}}
+        loader.instance = Mock()
+        loader._unload()
+        collect.assert_not_called()
+        loader.config = {'debug': True, 'skills': {}}
+        loader.instance = Mock()
+        loader._unload()
+        collect.assert_not_called()
+        loader.config = {'skills': {'gc_on_unload': True}}
+        loader.instance = Mock()
+        loader._unload()
+        collect.assert_called_once()
+        self.assertIsNone(loader.instance)
+
+    @patch("ovos_workshop.skill_launcher.gc.collect")
+    def test_skill_loader_garbage_collect(self, collect):
+        from ovos_workshop.skill_launcher import SkillLoader
+        import weakref
+
+        class Skill:
+            pass
+
+        loader = SkillLoader(self.bus, skill_id="gc.test")
+        with patch("ovos_workshop.skill_launcher.LOG") as log:
+            # released instance
+            skill = Skill()
+            skill_ref = weakref.ref(skill)
+            del skill
+            loader._garbage_collect(skill_ref)
+            collect.assert_called_once()
+            log.warning.assert_not_called()
+            # instance still referenced after collection
+            skill = Skill()
+            loader._garbage_collect(weakref.ref(skill))
+            self.assertEqual(collect.call_count, 2)
+            log.warning.assert_called_once()
+            # no instance to check
+            loader._garbage_collect()
+            self.assertEqual(collect.call_count, 3)
+            log.warning.assert_called_once()
+
     def test_skill_loader_load_skill(self):
         from ovos_workshop.skill_launcher import SkillLoader
         # TODO